@@ -1,15 +1,14 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final, Literal
 
 import ilthermopy as ilt
 import numpy as np
 import pandas as pd
-from tqdm import tqdm
 
 from ilml.featurization import IonicLiquidFeaturizer, ion_featurizers, combining_rules
-from ilml.chemistry import IonicLiquid
+from ilml.chemistry import Anion, Cation, IonicLiquid
 from ilml.dataset import ILMLDataset
 from ilml.exceptions import ILTEntryProcessingError
 
@@ -18,6 +17,18 @@ if TYPE_CHECKING:
 
 DATAFILES_DIR = Path(__file__).parent / "datafiles"
 
+ALLOWED_ELEMENTS: Final[frozenset[str]] = frozenset(
+    {
+        *("C", "H", "N", "O", "P", "S"),
+        *("F", "Cl", "Br", "I"),
+    }
+)
+
+N_JOBS: Final[int] = -1
+
+# Design tables are written as Parquet files; set to "csv" to write plain text.
+DATAFILE_FORMAT: Final[Literal["parquet", "csv"]] = "parquet"
+
 
 class Dataset(ILMLDataset):
     @staticmethod
@@ -40,15 +51,10 @@ class Dataset(ILMLDataset):
         data = ilt_entry.data.copy().rename(columns=ilt_entry.header)
 
         # Check the chemical composition of the IL associated with the entry.
-        allowed_elements = {
-            *("C", "H", "N", "O", "P", "S"),
-            *("F", "Cl", "Br", "I"),
-        }
-
         ionic_liquid_smiles = ilt_entry.components[0].smiles
         ionic_liquid = IonicLiquid.from_smiles(ionic_liquid_smiles)
 
-        if disallowed_elements := (ionic_liquid.element_set - allowed_elements):
+        if disallowed_elements := (ionic_liquid.element_set - ALLOWED_ELEMENTS):
             msg = (
                 f"entry {ilt_entry.id!r} contains disallowed elements: "
                 f"{', '.join(disallowed_elements)}"
@@ -102,20 +108,30 @@ class Dataset(ILMLDataset):
     def get_data(self) -> pd.DataFrame:
         data = super().get_data()
 
-        ionic_liquid_smiles = pd.Series(index=data.index, dtype="string")
-        cation_family = pd.Series(index=data.index, dtype="string")
-        anion_family = pd.Series(index=data.index, dtype="string")
+        # Classify the ions of all entries at once, then collect the ionic liquid
+        # metadata per entry and join it to the data.
+        ionic_liquids = [entry.ionic_liquid for entry in self.entries]
 
-        for entry_id in data.index.unique():
-            entry = self.get_entry(entry_id)
+        cation_families = Cation.find_chemical_families(
+            [ionic_liquid.cation for ionic_liquid in ionic_liquids]
+        )
+        anion_families = Anion.find_chemical_families(
+            [ionic_liquid.anion for ionic_liquid in ionic_liquids]
+        )
 
-            ionic_liquid_smiles.loc[entry_id] = entry.ionic_liquid.smiles
-            cation_family.loc[entry_id] = entry.ionic_liquid.cation.chemical_family
-            anion_family.loc[entry_id] = entry.ionic_liquid.anion.chemical_family
+        metadata = pd.DataFrame(
+            {
+                "ionic_liquid_smiles": [
+                    ionic_liquid.smiles for ionic_liquid in ionic_liquids
+                ],
+                "cation_family": cation_families,
+                "anion_family": anion_families,
+            },
+            index=pd.Index([entry.id for entry in self.entries], name="entry_id"),
+            dtype="string",
+        )
 
-        data.insert(0, "ionic_liquid_smiles", ionic_liquid_smiles)
-        data.insert(1, "cation_family", cation_family)
-        data.insert(2, "anion_family", anion_family)
+        data = data.join(metadata)
 
         data.reset_index(inplace=True, drop=False)
         data.set_index(
@@ -132,6 +148,12 @@ class Dataset(ILMLDataset):
 
 
 if __name__ == "__main__":
+    # Fail before the (long) featurization rather than when saving the results.
+    if DATAFILE_FORMAT not in {"parquet", "csv"}:
+        msg = f"unsupported datafile format: {DATAFILE_FORMAT!r}"
+
+        raise ValueError(msg)
+
     # Instance the dataset.
     dataset = Dataset()
 
@@ -139,20 +161,12 @@ if __name__ == "__main__":
     data = dataset.get_data()
 
     # For each ionic liquid get entry IDs.
-    entry_ids = pd.DataFrame.from_dict(
-        {
-            ionic_liquid_smiles: ",".join(
-                data.xs(ionic_liquid_smiles, level="ionic_liquid_smiles")
-                .index.get_level_values("entry_id")
-                .unique()
-                .to_list()
-            )
-            for ionic_liquid_smiles in data.index.get_level_values(
-                "ionic_liquid_smiles"
-            ).unique()
-        },
-        orient="index",
-        columns=["entry_ids"],
+    entry_ids = (
+        data.index.to_frame(index=False)
+        .groupby("ionic_liquid_smiles", sort=False)["entry_id"]
+        .unique()
+        .str.join(",")
+        .to_frame("entry_ids")
     )
 
     # Group the data by ionic liquid and average.
@@ -170,29 +184,37 @@ if __name__ == "__main__":
     if not DATAFILES_DIR.exists():
         DATAFILES_DIR.mkdir(parents=True, exist_ok=True)
 
+    # Parse each ionic liquid only once; the molecules are shared by all
+    # combinations of ion featurizers and combining rules.
+    ionic_liquids = [
+        IonicLiquid.from_smiles(ionic_liquid_smiles)
+        for ionic_liquid_smiles in data.index.get_level_values(
+            "ionic_liquid_smiles"
+        ).unique()
+    ]
+
+    ions = [
+        *(ionic_liquid.cation for ionic_liquid in ionic_liquids),
+        *(ionic_liquid.anion for ionic_liquid in ionic_liquids),
+    ]
+
     for ion_featurizer_name, ion_featurizer in ion_featurizers.items():
-        for combining_rule_name, combining_rule in combining_rules.items():
-            # Create a new design table for each combination of ion featurizer and
-            # combining rule.
-            design_table = data.copy()
+        # Featurize the distinct ions in parallel; the resulting table is shared by
+        # all combining rules.
+        ion_features = ion_featurizer.featurize_many(
+            ions,
+            n_jobs=N_JOBS,
+            progress=True,
+        )
 
+        for combining_rule_name, combining_rule in combining_rules.items():
             # Featurize the dataset.
             featurize = IonicLiquidFeaturizer(
                 ion_featurizer=ion_featurizer,
                 combining_rule=combining_rule,
             )
 
-            ionic_liquid_features = {}
-            for ionic_liquid_smiles in tqdm(
-                data.index.get_level_values("ionic_liquid_smiles"),
-                desc="Featurizing",
-            ):
-                ionic_liquid = IonicLiquid.from_smiles(ionic_liquid_smiles)
-
-                ionic_liquid_features[ionic_liquid_smiles] = featurize(ionic_liquid)
-
-            # Convert the features to a DataFrame.
-            features = pd.DataFrame.from_dict(ionic_liquid_features, orient="index")
+            features = featurize.combine(ionic_liquids, ion_features)
 
             # Filter out fragment/count-type features.
             features.drop(
@@ -213,9 +235,12 @@ if __name__ == "__main__":
 
             print(design_table.shape)
 
-            # Save the design table to a CSV file.
-            design_table.to_csv(
-                DATAFILES_DIR
-                / f"viscosity_{ion_featurizer_name}_{combining_rule_name}.csv",
-                index=True,
-            )
+            # Save the design table.
+            datafile_path = (
+                DATAFILES_DIR / f"viscosity_{ion_featurizer_name}_{combining_rule_name}"
+            ).with_suffix(f".{DATAFILE_FORMAT}")
+
+            if DATAFILE_FORMAT == "parquet":
+                design_table.to_parquet(datafile_path, compression="zstd", index=True)
+            elif DATAFILE_FORMAT == "csv":
+                design_table.to_csv(datafile_path, index=True)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from functools import cache, cached_property
 from typing import ClassVar, Self
 
 from rdkit import Chem
-from rdkit.Chem import Descriptors
+from rdkit.Chem import Descriptors, rdSubstructLibrary
 
 from .exceptions import InvalidChargeError
 
@@ -16,41 +18,97 @@ class Ion:
 
     family_smarts_patterns: ClassVar[dict[str, list[str]]] = {}
 
+    # Family patterns compiled once per class and flattened in precedence order:
+    # earlier families take priority over later, more generic ones.
+    _compiled_patterns: ClassVar[tuple[tuple[str, Chem.Mol], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+
+        cls._compiled_patterns = tuple(
+            (family_name, Chem.MolFromSmarts(pattern))
+            for family_name, smarts_patterns in cls.family_smarts_patterns.items()
+            for pattern in smarts_patterns
+        )
+
     def __post_init__(self) -> None:
         if self.charge == 0:
             msg = "ions must have a non-zero charge"
 
             raise InvalidChargeError(msg)
 
-    @property
-    def element_set(self) -> set[str]:
-        return {atom.GetSymbol() for atom in self.rdkit_mol.GetAtoms()}  # type: ignore[no-untyped-call]
+    @cached_property
+    def element_set(self) -> frozenset[str]:
+        return frozenset(atom.GetSymbol() for atom in self.rdkit_mol.GetAtoms())  # type: ignore[no-untyped-call]
 
-    @property
+    @cached_property
     def chemical_family(self) -> str | None:
-        for family_name, smarts_patterns in self.family_smarts_patterns.items():
-            for smart_pattern in smarts_patterns:
-                if self.rdkit_mol.HasSubstructMatch(Chem.MolFromSmarts(smart_pattern)):
-                    return family_name
+        for family_name, pattern in self._compiled_patterns:
+            if self.rdkit_mol.HasSubstructMatch(pattern):
+                return family_name
 
         return None
 
-    @property
+    @cached_property
     def charge(self) -> int:
         return Chem.GetFormalCharge(self.rdkit_mol)
 
-    @property
+    @cached_property
     def atom_count(self) -> int:
         return self.rdkit_mol.GetNumAtoms()
 
-    @property
+    @cached_property
     def molecular_weight(self) -> float:
         return Descriptors.MolWt(self.rdkit_mol)  # type: ignore[attr-defined, no-any-return]
 
     @classmethod
+    def find_chemical_families(cls, ions: Sequence[Ion]) -> list[str | None]:
+        # Equivalent to `chemical_family` evaluated for each ion, but every pattern
+        # is matched against all the distinct ions at once in a fingerprint-screened
+        # library.
+        unique_ions = list({ion.smiles: ion for ion in ions}.values())
+
+        library = rdSubstructLibrary.SubstructLibrary(
+            rdSubstructLibrary.MolHolder(),
+            rdSubstructLibrary.PatternHolder(),
+        )
+        for ion in unique_ions:
+            library.AddMol(ion.rdkit_mol)
+
+        families: list[str | None] = [None] * len(unique_ions)
+
+        for family_name, pattern in cls._compiled_patterns:
+            if None not in families:
+                break
+
+            for index in library.GetMatches(
+                pattern,
+                useChirality=False,
+                maxResults=len(unique_ions),
+            ):
+                if families[index] is None:
+                    families[index] = family_name
+
+        families_by_smiles = {
+            ion.smiles: family
+            for ion, family in zip(unique_ions, families, strict=True)
+        }
+
+        return [families_by_smiles[ion.smiles] for ion in ions]
+
+    @classmethod
+    @cache
     def from_smiles(cls, smiles: str) -> Self:
         rdkit_molecule = Chem.MolFromSmiles(smiles)
-        smiles = Chem.MolToSmiles(rdkit_molecule, isomericSmiles=False)
+
+        # Drop stereochemistry and isotope labels from the molecule itself, so that it
+        # matches the canonical (non-isomeric) SMILES without parsing the latter again.
+        Chem.RemoveStereochemistry(rdkit_molecule)
+
+        for atom in rdkit_molecule.GetAtoms():
+            atom.SetIsotope(0)
+
+        smiles = Chem.MolToSmiles(rdkit_molecule)
 
         return cls(smiles, rdkit_molecule)
 
@@ -198,19 +256,20 @@ class IonicLiquid:
     def smiles(self) -> str:
         return f"{self.cation.smiles}.{self.anion.smiles}"
 
-    @property
-    def element_set(self) -> set[str]:
+    @cached_property
+    def element_set(self) -> frozenset[str]:
         return self.cation.element_set | self.anion.element_set
 
-    @property
+    @cached_property
     def atom_count(self) -> int:
         return self.cation.atom_count + self.anion.atom_count
 
-    @property
+    @cached_property
     def molecular_weight(self) -> float:
         return self.cation.molecular_weight + self.anion.molecular_weight
 
     @classmethod
+    @cache
     def from_smiles(cls, smiles: str) -> Self:
         left_smiles, right_smiles = smiles.split(".")
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 import ilthermopy as ilt
 import pandas as pd
@@ -17,10 +18,21 @@ if TYPE_CHECKING:
 
 ilt_get_entry = cache(ilt.GetEntry)
 
+ILT_MAX_WORKERS: Final[int] = 16
+
 
 @dataclass
 class ILMLDataset(ABC):
-    entries: list[ILMLEntry] = field(default_factory=list, repr=False)
+    # Entries are stored in a tuple, so that they cannot be changed without
+    # updating the index below.
+    entries: tuple[ILMLEntry, ...] = field(default=(), repr=False)
+
+    _entries_by_id: dict[str, ILMLEntry] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     def __post_init__(self) -> None:
         self._populate()
@@ -39,13 +51,12 @@ class ILMLDataset(ABC):
         pass
 
     def get_entry(self, entry_id: str) -> ILMLEntry:
-        for entry in self.entries:
-            if entry.id == entry_id:
-                return entry
-
-        msg = f"could not find entry with ID {entry_id!r}"
+        try:
+            return self._entries_by_id[entry_id]
+        except KeyError as exc:
+            msg = f"could not find entry with ID {entry_id!r}"
 
-        raise LookupError(msg)
+            raise LookupError(msg) from exc
 
     def get_data(self) -> pd.DataFrame:
         if not (entries := self.entries):
@@ -79,11 +90,23 @@ class ILMLDataset(ABC):
         return references
 
     def _populate(self) -> None:
+        entries = list(self.entries)
+
+        for entry in entries:
+            self._entries_by_id.setdefault(entry.id, entry)
+
         ilt_entry_ids = self.get_ilt_entry_ids()
 
-        for ilt_entry_id in tqdm(ilt_entry_ids):
-            ilt_entry = ilt_get_entry(ilt_entry_id)
+        # Fetching entries is network-bound, so the requests are run concurrently.
+        with ThreadPoolExecutor(max_workers=ILT_MAX_WORKERS) as executor:
+            ilt_entries = list(
+                tqdm(
+                    executor.map(ilt_get_entry, ilt_entry_ids),
+                    total=len(ilt_entry_ids),
+                )
+            )
 
+        for ilt_entry in ilt_entries:
             try:
                 ilt_entry = self.process_ilt_entry(ilt_entry)
             except ILTEntryProcessingError:
@@ -91,4 +114,7 @@ class ILMLDataset(ABC):
 
             entry = ILMLEntry(ilt_entry)
 
-            self.entries.append(entry)
+            entries.append(entry)
+            self._entries_by_id.setdefault(entry.id, entry)
+
+        self.entries = tuple(entries)
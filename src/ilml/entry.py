@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from .chemistry import IonicLiquid
@@ -25,6 +26,6 @@ class ILMLEntry:
     def data(self) -> pd.DataFrame:
         return self.ilt_entry.data
 
-    @property
+    @cached_property
     def ionic_liquid(self) -> IonicLiquid:
         return IonicLiquid.from_smiles(self.ilt_entry.components[0].smiles)
@@ -2,9 +2,14 @@ from __future__ import annotations
 
 from collections.abc import Callable
 
+import numpy as np
+import numpy.typing as npt
+
 from ilml.chemistry import IonicLiquid
 
-type CombiningRule = Callable[[IonicLiquid, float, float], float]
+type Features = npt.NDArray[np.float64]
+
+type CombiningRule = Callable[[IonicLiquid, Features, Features], Features]
 
 combining_rules: dict[str, CombiningRule | None] = {"concatenate": None}
 
@@ -18,58 +23,58 @@ def register(func: CombiningRule) -> CombiningRule:
 @register
 def sum(
     ionic_liquid: IonicLiquid,
-    cation_feature: float,
-    anion_feature: float,
-) -> float:
-    return cation_feature + anion_feature
+    cation_features: Features,
+    anion_features: Features,
+) -> Features:
+    return cation_features + anion_features
 
 
 @register
 def min_abs(
     ionic_liquid: IonicLiquid,
-    cation_feature: float,
-    anion_feature: float,
-) -> float:
-    return float(min(abs(cation_feature), abs(anion_feature)))
+    cation_features: Features,
+    anion_features: Features,
+) -> Features:
+    return np.minimum(np.abs(cation_features), np.abs(anion_features))
 
 
 @register
 def max_abs(
     ionic_liquid: IonicLiquid,
-    cation_feature: float,
-    anion_feature: float,
-) -> float:
-    return float(max(abs(cation_feature), abs(anion_feature)))
+    cation_features: Features,
+    anion_features: Features,
+) -> Features:
+    return np.maximum(np.abs(cation_features), np.abs(anion_features))
 
 
 @register
 def mean(
     ionic_liquid: IonicLiquid,
-    cation_feature: float,
-    anion_feature: float,
-) -> float:
-    return 0.5 * (cation_feature + anion_feature)
+    cation_features: Features,
+    anion_features: Features,
+) -> Features:
+    return 0.5 * (cation_features + anion_features)
 
 
 @register
 def mean_atom_count(
     ionic_liquid: IonicLiquid,
-    cation_feature: float,
-    anion_feature: float,
-) -> float:
+    cation_features: Features,
+    anion_features: Features,
+) -> Features:
     return (
-        (ionic_liquid.cation.atom_count * cation_feature)
-        + (ionic_liquid.anion.atom_count * anion_feature)
+        (ionic_liquid.cation.atom_count * cation_features)
+        + (ionic_liquid.anion.atom_count * anion_features)
     ) / ionic_liquid.atom_count
 
 
 @register
 def mean_molecular_weight(
     ionic_liquid: IonicLiquid,
-    cation_feature: float,
-    anion_feature: float,
-) -> float:
+    cation_features: Features,
+    anion_features: Features,
+) -> Features:
     return (
-        (ionic_liquid.cation.molecular_weight * cation_feature)
-        + (ionic_liquid.anion.molecular_weight * anion_feature)
+        (ionic_liquid.cation.molecular_weight * cation_features)
+        + (ionic_liquid.anion.molecular_weight * anion_features)
     ) / ionic_liquid.molecular_weight
@@ -1,26 +1,46 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import padelpy
+import pandas as pd
+from joblib import Parallel, delayed
+from rdkit import Chem, rdBase
 from rdkit.Chem.Descriptors import CalcMolDescriptors
+from tqdm import tqdm
 
-from ilml.memory import cache
+from ilml.memory import cache, versioned_cache
 
 from .combining_rules import CombiningRule
 
 if TYPE_CHECKING:
     from ilml.chemistry import Ion, IonicLiquid
 
-rdkit_calc_mol_descriptors = cache(CalcMolDescriptors)
+
+def calc_mol_descriptors(smiles: str) -> dict[str, Any]:
+    return CalcMolDescriptors(Chem.MolFromSmiles(smiles))  # type: ignore[no-untyped-call, no-any-return]
+
+
+rdkit_calc_mol_descriptors = lru_cache(maxsize=4096)(
+    versioned_cache(f"rdkit-{rdBase.rdkitVersion}")(calc_mol_descriptors)
+)
 
 padelpy_from_smiles = cache(padelpy.from_smiles)
 
 ion_featurizers: dict[str, IonFeaturizer] = {}
 
 
+def to_float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
 def register(name: str) -> Callable[[type[IonFeaturizer]], type[IonFeaturizer]]:
     def decorator(ion_featurizer_class: type[IonFeaturizer]) -> type[IonFeaturizer]:
         ion_featurizers.update({name: ion_featurizer_class()})
@@ -32,15 +52,37 @@ def register(name: str) -> Callable[[type[IonFeaturizer]], type[IonFeaturizer]]:
 
 class IonFeaturizer(ABC):
     def __call__(self, ion: Ion) -> dict[str, float]:
-        features = self._featurize(ion)
-
-        for name, value in features.items():
-            try:
-                features[name] = float(value)
-            except (TypeError, ValueError):
-                features[name] = None
+        return {
+            name: feature
+            for name, value in self._featurize(ion).items()
+            if (feature := to_float(value)) is not None
+        }
 
-        return {name: value for name, value in features.items() if value is not None}
+    def featurize_many(
+        self,
+        ions: Sequence[Ion],
+        n_jobs: int | None = None,
+        progress: bool = False,
+    ) -> pd.DataFrame:
+        # Each distinct ion is featurized only once; the resulting table is indexed
+        # by the ions' SMILES.
+        unique_ions = {ion.smiles: ion for ion in ions}
+
+        features = Parallel(n_jobs=n_jobs, return_as="generator")(
+            delayed(self)(ion) for ion in unique_ions.values()
+        )
+
+        return pd.DataFrame.from_records(
+            list(
+                tqdm(
+                    features,
+                    total=len(unique_ions),
+                    desc="Featurizing",
+                    disable=not progress,
+                )
+            ),
+            index=list(unique_ions),
+        )
 
     @abstractmethod
     def _featurize(self, ion: Ion) -> dict[str, Any]:
@@ -50,7 +92,7 @@ class IonFeaturizer(ABC):
 @register("RDKit")
 class RDKitIonFeaturizer(IonFeaturizer):
     def _featurize(self, ion: Ion) -> dict[str, Any]:
-        return rdkit_calc_mol_descriptors(ion.rdkit_mol)  # type: ignore[no-any-return]
+        return rdkit_calc_mol_descriptors(ion.smiles)  # type: ignore[no-any-return]
 
 
 @register("PaDEL")
@@ -73,21 +115,21 @@ class IonicLiquidFeaturizer:
         anion_features = self.ion_featurizer(ionic_liquid.anion)
 
         if (combining_rule := self.combining_rule) is not None:
-            feature_names = set(cation_features) | set(anion_features)
-
-            ionic_liquid_features = {}
-            for name in feature_names:
-                if not (
-                    (cation_feature := cation_features[name]) is not None
-                    and (anion_feature := anion_features.get(name)) is not None
-                ):
-                    continue
-
-                ionic_liquid_features[name] = combining_rule(
-                    ionic_liquid,
-                    cation_feature,
-                    anion_feature,
+            # Only features available for both ions can be combined; the rule is
+            # applied to all of them at once.
+            feature_names = [name for name in cation_features if name in anion_features]
+
+            ionic_liquid_features = dict(
+                zip(
+                    feature_names,
+                    combining_rule(
+                        ionic_liquid,
+                        np.array([cation_features[name] for name in feature_names]),
+                        np.array([anion_features[name] for name in feature_names]),
+                    ).tolist(),
+                    strict=True,
                 )
+            )
         else:
             ionic_liquid_features = {
                 **{f"{name}_cation": value for name, value in cation_features.items()},
@@ -95,3 +137,73 @@ class IonicLiquidFeaturizer:
             }
 
         return ionic_liquid_features
+
+    def featurize_many(
+        self,
+        ionic_liquids: Sequence[IonicLiquid],
+        n_jobs: int | None = None,
+        progress: bool = False,
+    ) -> pd.DataFrame:
+        ion_features = self.ion_featurizer.featurize_many(
+            [
+                *(ionic_liquid.cation for ionic_liquid in ionic_liquids),
+                *(ionic_liquid.anion for ionic_liquid in ionic_liquids),
+            ],
+            n_jobs=n_jobs,
+            progress=progress,
+        )
+
+        return self.combine(ionic_liquids, ion_features)
+
+    def combine(
+        self,
+        ionic_liquids: Sequence[IonicLiquid],
+        ion_features: pd.DataFrame,
+    ) -> pd.DataFrame:
+        # The ion features table (see `IonFeaturizer.featurize_many`) does not depend
+        # on the combining rule, so it can be shared by featurizers using different
+        # rules.
+        index = pd.Index([ionic_liquid.smiles for ionic_liquid in ionic_liquids])
+
+        cation_features = (
+            ion_features.loc[
+                [ionic_liquid.cation.smiles for ionic_liquid in ionic_liquids]
+            ]
+            .dropna(axis=1, how="all")
+            .set_axis(index)
+        )
+        anion_features = (
+            ion_features.loc[
+                [ionic_liquid.anion.smiles for ionic_liquid in ionic_liquids]
+            ]
+            .dropna(axis=1, how="all")
+            .set_axis(index)
+        )
+
+        if (combining_rule := self.combining_rule) is None:
+            return pd.concat(
+                [
+                    cation_features.add_suffix("_cation"),
+                    anion_features.add_suffix("_anion"),
+                ],
+                axis=1,
+            )
+
+        feature_names = cation_features.columns.intersection(
+            anion_features.columns,
+            sort=False,
+        )
+
+        return pd.DataFrame(
+            [
+                combining_rule(ionic_liquid, cation_values, anion_values)
+                for ionic_liquid, cation_values, anion_values in zip(
+                    ionic_liquids,
+                    cation_features[feature_names].to_numpy(dtype=float),
+                    anion_features[feature_names].to_numpy(dtype=float),
+                    strict=True,
+                )
+            ],
+            index=index,
+            columns=feature_names,
+        )
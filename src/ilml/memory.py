@@ -1,7 +1,18 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from joblib.memory import Memory
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 _memory = Memory("./.ilml_cache", verbose=0)
 
 cache = _memory.cache
+
+
+def versioned_cache(version: str) -> Callable[..., Any]:
+    # Results are stored in a separate, version-specific location, so that they are
+    # recomputed whenever the version changes.
+    return Memory(f"./.ilml_cache/{version}", verbose=0).cache  # type: ignore[no-any-return]